@@ -1,11 +1,152 @@
 import os
-import yaml
-import argparse
+import functools
 import logging
-import shutil
-from datetime import datetime
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Any, Tuple
+
+# yaml e argparse são importados sob demanda para reduzir o tempo de
+# inicialização (ex.: --help/--version não precisam do PyYAML)
+if TYPE_CHECKING:
+    import argparse
+
+YAML_EXTENSIONS = ('.yml', '.yaml')
+LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+# Modelo do documento gerado, preenchido com str.format_map
+DOC_TEMPLATE = """# {role_name}
+
+## Description
+{description}
+
+## Role Information
+- **Author:** {author}
+- **License:** {license}
+- **Minimum Ansible Version:** {min_ansible_version}
+
+## Directory Structure
+{dir_structure}
+
+## Supported Platforms
+{platforms}
+
+## Role Dependencies
+{dependencies}
+
+## Role Variables
+
+### Defaults
+```yaml
+{defaults}
+```
+
+### Variables
+```yaml
+{vars}
+```
+
+## Tasks
+{tasks_section}
+
+## Handlers
+{handlers_section}
+
+## Example Playbook
+```yaml
+- hosts: servers
+  roles:
+    - role: {role_name}
+```
+
+## License
+This role is licensed under {license}.
+
+## Author Information
+Created by {author}
+
+---
+*Documentation generated on {generated_at}*
+"""
+
+
+@functools.lru_cache(maxsize=None)
+def _yaml_classes() -> Tuple[type, type]:
+    """
+    Import PyYAML on first use and pick its loader/dumper classes.
+    
+    Returns:
+        Tuple[type, type]: libyaml-backed CSafeLoader/CSafeDumper when available,
+            otherwise the pure-Python SafeLoader/SafeDumper
+    """
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+    return SafeLoader, SafeDumper
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_yaml_cached(file_path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a YAML file, memoized on its path, modification time and size.
+    
+    The file is read with a single os.read sized from its stat result and
+    the raw bytes are handed to the parser, skipping the buffered text layer.
+    The returned object is shared between calls and must not be mutated.
+    
+    Args:
+        file_path (str): Path to the YAML file
+        mtime_ns (int): File modification time, used to invalidate the cache
+        size (int): File size in bytes, from the same stat call
+        
+    Returns:
+        Any: Parsed YAML content or empty dict for empty documents
+    """
+    import yaml
+    
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        data = os.read(fd, size)
+        # Leituras curtas são raras em arquivos regulares, mas possíveis
+        while len(data) < size:
+            chunk = os.read(fd, size - len(data))
+            if not chunk:
+                break
+            data += chunk
+    finally:
+        os.close(fd)
+    safe_loader, _ = _yaml_classes()
+    return yaml.load(data, Loader=safe_loader) or {}
+
+
+class _LazyFileHandler(logging.FileHandler):
+    """
+    File handler that only creates its log directory and file once a
+    WARNING or higher record is logged.
+    
+    Lower-level records are kept in memory until then, so the log file
+    still holds the full context of the run.
+    """
+
+    def __init__(self, filename: str):
+        super().__init__(filename, delay=True)
+        self._pending: List[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None and record.levelno < logging.WARNING:
+            self._pending.append(record)
+            return
+        pending, self._pending = self._pending, []
+        for pending_record in pending:
+            super().emit(pending_record)
+        super().emit(record)
+
+    def _open(self):
+        Path(os.path.dirname(self.baseFilename)).mkdir(exist_ok=True)
+        return super()._open()
+
 
 class AnsibleDocGenerator:
     def __init__(self, role_directory: str, output_path: Optional[str] = None, logging_directory: str = "logs"):
@@ -19,22 +160,34 @@ class AnsibleDocGenerator:
         """
         self.role_directory = role_directory
         self.output_path = output_path or os.path.join(role_directory, 'DOCUMENTATION.md')
+        # Caminhos fixos da role calculados uma única vez
+        self._tasks_dir = os.path.join(role_directory, 'tasks')
+        self._paths = {
+            dir_name: os.path.join(role_directory, dir_name, 'main.yml')
+            for dir_name in ('meta', 'defaults', 'vars', 'handlers')
+        }
         self.logger = self._setup_logging(logging_directory)
 
     def _setup_logging(self, logging_directory: str) -> logging.Logger:
-        """Configure enhanced logging system with rotation"""
-        Path(logging_directory).mkdir(exist_ok=True)
-        log_file = os.path.join(logging_directory, f"docgen_{datetime.now():%Y%m%d_%H%M%S}.log")
+        """
+        Configure logging to console and to a lazily created log file.
         
+        The log file is only created once a WARNING or higher record is
+        emitted, so clean runs leave no log file behind.
+        """
         logger = logging.getLogger("AnsibleDocGenerator")
+        # Handlers são configurados uma única vez por processo; novas instâncias
+        # reutilizam o logger em vez de duplicar cada registro
+        if logger.handlers:
+            return logger
         logger.setLevel(logging.INFO)
         
-        file_handler = logging.FileHandler(log_file)
+        log_file = os.path.join(logging_directory, f"docgen_{time.strftime('%Y%m%d_%H%M%S')}.log")
+        file_handler = _LazyFileHandler(log_file)
         console_handler = logging.StreamHandler()
         
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
+        file_handler.setFormatter(LOG_FORMATTER)
+        console_handler.setFormatter(LOG_FORMATTER)
         
         logger.addHandler(file_handler)
         logger.addHandler(console_handler)
@@ -51,13 +204,14 @@ class AnsibleDocGenerator:
         Returns:
             Dict: Parsed YAML content or empty dict if file doesn't exist
         """
-        if not os.path.exists(file_path):
+        import yaml
+        
+        try:
+            st = os.stat(file_path)
+            return _parse_yaml_cached(file_path, st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
             self.logger.warning(f"File not found: {file_path}")
             return {}
-            
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
         except yaml.YAMLError as e:
             self.logger.error(f"YAML parsing error in {file_path}: {str(e)}")
             return {}
@@ -75,9 +229,16 @@ class AnsibleDocGenerator:
         required_dirs = ['meta', 'tasks', 'defaults', 'handlers', 'vars', 'templates', 'files']
         structure = {}
         
+        # Uma única leitura do diretório da role em vez de um stat por subdiretório
+        try:
+            with os.scandir(self.role_directory) as entries:
+                found = {entry.name for entry in entries if entry.is_dir()}
+        except OSError as e:
+            self.logger.error(f"Error scanning role directory {self.role_directory}: {str(e)}")
+            found = set()
+        
         for dir_name in required_dirs:
-            dir_path = os.path.join(self.role_directory, dir_name)
-            exists = os.path.isdir(dir_path)
+            exists = dir_name in found
             structure[dir_name] = exists
             
             if not exists:
@@ -85,58 +246,117 @@ class AnsibleDocGenerator:
             
         return structure
 
-    def _get_role_variables(self) -> Dict[str, Any]:
+    def _read_main_file(self, dir_name: str, structure: Optional[Dict[str, bool]] = None) -> Dict:
+        """
+        Read <dir_name>/main.yml from the role.
+        
+        Args:
+            dir_name (str): Role subdirectory (meta, defaults, vars, handlers)
+            structure (Optional[Dict[str, bool]]): Result of _validate_role_structure,
+                used to skip the read when the directory is known to be missing
+            
+        Returns:
+            Dict: Parsed YAML content or empty dict
+        """
+        if structure is not None and not structure.get(dir_name):
+            return {}
+        return self._read_yaml_file(self._paths[dir_name])
+
+    def _get_role_variables(self, structure: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
         """
         Extract and combine variables from defaults and vars.
         
+        Args:
+            structure (Optional[Dict[str, bool]]): Result of _validate_role_structure
+        
         Returns:
             Dict[str, Any]: Combined variables from defaults and vars
         """
-        defaults = self._read_yaml_file(os.path.join(self.role_directory, 'defaults', 'main.yml'))
-        vars_data = self._read_yaml_file(os.path.join(self.role_directory, 'vars', 'main.yml'))
+        defaults = self._read_main_file('defaults', structure)
+        vars_data = self._read_main_file('vars', structure)
         
         return {
             'defaults': defaults,
             'vars': vars_data
         }
 
-    def _get_tasks_info(self) -> List[Dict[str, str]]:
+    def _iter_task_lines(self, structure: Optional[Dict[str, bool]] = None) -> Iterator[str]:
         """
-        Extract information about tasks from main.yml and included files.
+        Yield the documentation lines for tasks from main.yml and included files.
         
-        Returns:
-            List[Dict[str, str]]: List of task information
+        Args:
+            structure (Optional[Dict[str, bool]]): Result of _validate_role_structure,
+                used to skip the tasks directory without touching the filesystem
+                when it is already known to be missing
+        
+        Yields:
+            str: One Markdown list item per named task
+        """
+        tasks_dir = self._tasks_dir
+        
+        if structure is not None and not structure.get('tasks'):
+            return
+            
+        task_files = list(self._iter_yaml_files(tasks_dir))
+        
+        # Lê e faz o parsing dos arquivos em paralelo; map preserva a ordem
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            parsed_files = list(executor.map(self._read_yaml_file, task_files))
+            
+        # Os caminhos vêm do scandir sob tasks_dir, então o caminho relativo é só o sufixo
+        prefix_len = len(tasks_dir) + 1
+        
+        # O SafeLoader só produz list/dict/str nativos, então type() is basta
+        for file_path, tasks in zip(task_files, parsed_files):
+            if type(tasks) is not list:
+                continue
+            relative_path = file_path[prefix_len:]
+            for task in tasks:
+                if type(task) is not dict or 'name' not in task:
+                    continue
+                # Processa as tags: string única, lista (juntada com vírgulas) ou ausente
+                tags = task.get('tags')
+                if not tags:
+                    yield f"- {task['name']} ({relative_path})\n"
+                    continue
+                if type(tags) is str:
+                    tags_str = tags
+                else:
+                    tags_str = ', '.join(map(str, tags))
+                yield f"- {task['name']} ({relative_path}) [Tags: {tags_str}]\n"
+
+    def _iter_yaml_files(self, directory: str) -> Iterator[str]:
         """
-        tasks_dir = os.path.join(self.role_directory, 'tasks')
-        tasks_info = []
+        Recursively yield YAML file paths under a directory, top-down.
+        
+        Uses os.scandir so file/directory checks are answered from the
+        directory entry itself instead of an extra stat per entry.
         
-        if not os.path.exists(tasks_dir):
-            return tasks_info
+        Args:
+            directory (str): Directory to traverse
             
-        for root, _, files in os.walk(tasks_dir):
-            for file in files:
-                if file.endswith(('.yml', '.yaml')):
-                    file_path = os.path.join(root, file)
-                    tasks = self._read_yaml_file(file_path)
-                    
-                    if isinstance(tasks, list):
-                        for task in tasks:
-                            if isinstance(task, dict) and 'name' in task:
-                                # Processa as tags de forma adequada
-                                tags = task.get('tags', [])
-                                # Se tags for uma string, converte para lista
-                                if isinstance(tags, str):
-                                    tags = [tags]
-                                # Se for lista, junta com vírgulas
-                                tags_str = ', '.join(tags) if tags else ''
-                                
-                                tasks_info.append({
-                                    'name': task['name'],
-                                    'file': os.path.relpath(file_path, tasks_dir),
-                                    'tags': tags_str
-                                })
-                                
-        return tasks_info
+        Yields:
+            str: Path of each .yml/.yaml file found
+        """
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    # Testa o nome primeiro: é só uma comparação de strings, enquanto
+                    # is_file() pode exigir um stat (ex.: links simbólicos)
+                    if entry.name.endswith(YAML_EXTENSIONS) and entry.is_file():
+                        yield entry.path
+                    elif entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            self.logger.warning(f"Error scanning {directory}: {str(e)}")
+            return
+            
+        for subdir in subdirs:
+            yield from self._iter_yaml_files(subdir)
 
     def _format_platforms(self, platforms: List[Dict]) -> str:
         """Format platform information for documentation"""
@@ -168,26 +388,51 @@ class AnsibleDocGenerator:
                 
         return '\n'.join(dep_info)
 
-    def _get_handlers_info(self) -> List[Dict[str, str]]:
+    def _format_variables(self, variables: Any) -> str:
+        """Format role variables as YAML using the libyaml emitter when available"""
+        import yaml
+        
+        _, safe_dumper = _yaml_classes()
+        return yaml.dump(variables, Dumper=safe_dumper, default_flow_style=False, sort_keys=False)
+
+    def _iter_handler_lines(self, structure: Optional[Dict[str, bool]] = None) -> Iterator[str]:
         """
-        Extract information about handlers.
+        Yield the documentation lines for handlers.
         
-        Returns:
-            List[Dict[str, str]]: List of handler information
+        Args:
+            structure (Optional[Dict[str, bool]]): Result of _validate_role_structure
+        
+        Yields:
+            str: One Markdown list item per named handler
         """
-        handlers_file = os.path.join(self.role_directory, 'handlers', 'main.yml')
-        handlers = self._read_yaml_file(handlers_file)
+        handlers = self._read_main_file('handlers', structure)
         
-        handlers_info = []
         if isinstance(handlers, list):
             for handler in handlers:
                 if isinstance(handler, dict) and 'name' in handler:
-                    handlers_info.append({
-                        'name': handler['name'],
-                        'listen': handler.get('listen', '')
-                    })
-                    
-        return handlers_info
+                    listen = handler.get('listen')
+                    if listen:
+                        yield f"- {handler['name']} (listen: {listen})\n"
+                    else:
+                        yield f"- {handler['name']}\n"
+
+    def _write_output(self, content: str) -> None:
+        """
+        Write the documentation to the output path with unbuffered I/O.
+        
+        Args:
+            content (str): Documentation content to write
+        """
+        data = memoryview(content.encode('utf-8'))
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+        fd = os.open(self.output_path, flags, 0o644)
+        try:
+            # os.write pode escrever parcialmente; repete até gravar tudo
+            while data:
+                written = os.write(fd, data)
+                data = data[written:]
+        finally:
+            os.close(fd)
 
     def generate_documentation(self) -> str:
         """
@@ -200,12 +445,12 @@ class AnsibleDocGenerator:
         
         structure = self._validate_role_structure()
         
-        meta = self._read_yaml_file(os.path.join(self.role_directory, 'meta', 'main.yml'))
+        meta = self._read_main_file('meta', structure)
         galaxy_info = meta.get('galaxy_info', {})
         
-        variables = self._get_role_variables()
-        tasks = self._get_tasks_info()
-        handlers = self._get_handlers_info()
+        variables = self._get_role_variables(structure)
+        tasks_section = ''.join(self._iter_task_lines(structure))
+        handlers_section = ''.join(self._iter_handler_lines(structure))
         
         # Gera o conteúdo da documentação
         role_name = galaxy_info.get('role_name', 'Ansible Role')
@@ -215,100 +460,45 @@ class AnsibleDocGenerator:
         min_ansible_version = galaxy_info.get('min_ansible_version', 'Not specified')
         
         # Controi a estrutura do diretório
-        dir_structure = ''
+        dir_lines = []
         for dir_name, exists in structure.items():
             check_mark = '✓' if exists else '✗'
-            dir_structure += f"- {dir_name}/: {check_mark}\n"
-
-        tasks_section = ''
-        for task in tasks:
-            task_name = task['name']
-            task_file = task['file']
-            task_tags = task['tags']
-            tasks_section += f"- {task_name} ({task_file})"
-            if task_tags:
-                tasks_section += f" [Tags: {task_tags}]"
-            tasks_section += "\n"
-        # Controi a seção de handlers
-        handlers_section = ''
-        for handler in handlers:
-            handler_name = handler['name']
-            handler_listen = handler['listen']
-            handlers_section += f"- {handler_name}"
-            if handler_listen:
-                handlers_section += f" (listen: {handler_listen})"
-            handlers_section += "\n"
-
-        doc_content = f"""# {role_name}
-
-## Description
-{description}
-
-## Role Information
-- **Author:** {author}
-- **License:** {license}
-- **Minimum Ansible Version:** {min_ansible_version}
-
-## Directory Structure
-{dir_structure}
-
-## Supported Platforms
-{self._format_platforms(galaxy_info.get('platforms', []))}
-
-## Role Dependencies
-{self._format_dependencies(meta.get('dependencies', []))}
-
-## Role Variables
-
-### Defaults
-```yaml
-{yaml.dump(variables['defaults'], default_flow_style=False, sort_keys=False)}
-```
-
-### Variables
-```yaml
-{yaml.dump(variables['vars'], default_flow_style=False, sort_keys=False)}
-```
-
-## Tasks
-{tasks_section}
-
-## Handlers
-{handlers_section}
-
-## Example Playbook
-```yaml
-- hosts: servers
-  roles:
-    - role: {role_name}
-```
-
-## License
-This role is licensed under {license}.
-
-## Author Information
-Created by {author}
-
----
-*Documentation generated on {datetime.now():%Y-%m-%d %H:%M:%S}*
-"""
+            dir_lines.append(f"- {dir_name}/: {check_mark}\n")
+        dir_structure = ''.join(dir_lines)
+
+        doc_content = DOC_TEMPLATE.format_map({
+            'role_name': role_name,
+            'description': description,
+            'author': author,
+            'license': license,
+            'min_ansible_version': min_ansible_version,
+            'dir_structure': dir_structure,
+            'platforms': self._format_platforms(galaxy_info.get('platforms', [])),
+            'dependencies': self._format_dependencies(meta.get('dependencies', [])),
+            'defaults': self._format_variables(variables['defaults']),
+            'vars': self._format_variables(variables['vars']),
+            'tasks_section': tasks_section,
+            'handlers_section': handlers_section,
+            'generated_at': time.strftime('%Y-%m-%d %H:%M:%S')
+        })
         
         try:
-            with open(self.output_path, 'w', encoding='utf-8') as f:
-                f.write(doc_content)
+            self._write_output(doc_content)
             self.logger.info(f"Documentation saved to {self.output_path}")
         except Exception as e:
             self.logger.error(f"Error saving documentation: {str(e)}")
             
         return doc_content
     
-def initialize_argument_parser() -> argparse.ArgumentParser:
+def initialize_argument_parser() -> 'argparse.ArgumentParser':
     """
     Initialize and configure the argument parser with detailed help messages.
     
     Returns:
         argparse.ArgumentParser: Configured argument parser
     """
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="""
         Ansible Role Documentation Generator
@@ -327,7 +517,8 @@ def initialize_argument_parser() -> argparse.ArgumentParser:
 
     parser.add_argument(
         'role_directory',
-        help='Path to the Ansible role directory to analyze'
+        nargs='+',
+        help='Path to the Ansible role directory to analyze (several roles are processed in parallel)'
     )
 
     parser.add_argument(
@@ -359,17 +550,54 @@ def initialize_argument_parser() -> argparse.ArgumentParser:
 
     return parser
 
+def _generate_role_documentation(role_directory: str, output_path: Optional[str], logging_directory: str) -> None:
+    """Generate documentation for a single role (module-level so worker processes can run it)"""
+    doc_generator = AnsibleDocGenerator(
+        role_directory=role_directory,
+        output_path=output_path,
+        logging_directory=logging_directory
+    )
+    doc_generator.generate_documentation()
+
+def batch(role_directories: List[str], logging_directory: str = "logs") -> int:
+    """
+    Generate documentation for several roles, one worker process per CPU.
+    
+    Each role's documentation is written to DOCUMENTATION.md in its own directory.
+    
+    Args:
+        role_directories (List[str]): Paths to the Ansible role directories
+        logging_directory (str): Directory for log files
+        
+    Returns:
+        int: Number of roles whose documentation could not be generated
+    """
+    failures = 0
+    with ProcessPoolExecutor() as executor:
+        futures = [
+            executor.submit(_generate_role_documentation, role_directory, None, logging_directory)
+            for role_directory in role_directories
+        ]
+        for role_directory, future in zip(role_directories, futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Error ({role_directory}): {str(e)}")
+                failures += 1
+                
+    return failures
+
 def main():
     parser = initialize_argument_parser()
     args = parser.parse_args()
     
+    if len(args.role_directory) > 1 and args.output:
+        parser.error('--output can only be used with a single role directory')
+    
     try:
-        doc_generator = AnsibleDocGenerator(
-            role_directory=args.role_directory,
-            output_path=args.output,
-            logging_directory=args.logs
-        )
-        doc_generator.generate_documentation()
+        if len(args.role_directory) > 1:
+            return 1 if batch(args.role_directory, args.logs) else 0
+        _generate_role_documentation(args.role_directory[0], args.output, args.logs)
     except Exception as e:
         print(f"Error: {str(e)}")
         return 1
@@ -377,4 +605,4 @@ def main():
     return 0
 
 if __name__ == '__main__':
-    exit(main())
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file